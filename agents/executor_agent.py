@@ -3,21 +3,41 @@ Decision Executor Agent
 Makes final trading decisions and manages portfolio risk
 """
 
+import hashlib
 import logging
-import json
-from datetime import datetime, timezone
+import os
+import time
+import orjson
 import openai
 from prompts.collaborative_trading_prompts import CollaborativeTradingPrompts
+from utils.retry import call_with_retries
 
 logger = logging.getLogger("CollaborativeTrader")
 
+# USD per 1K tokens (input, output) by model
+MODEL_PRICING = {
+    "gpt-4-turbo-preview": (0.01, 0.03),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-3.5-turbo": (0.0015, 0.002)
+}
+
+# How long a decision stays reusable for an unchanged trading picture
+# before the LLM is consulted again. Must exceed the longest cycle
+# period (15 min off-hours plus cycle work) or steady-state lookups
+# always miss.
+DECISION_CACHE_TTL = 1800
+DECISION_CACHE_MAX_ENTRIES = 128
+
 class ExecutorAgent:
     """Executor Agent that makes final trading decisions"""
-    
+
     def __init__(self, budget_manager):
         self.model = "gpt-4-turbo-preview"
         self.cost_estimate = 0.60
         self.budget_manager = budget_manager
+        self._results_file = None
+        # analysis digest -> (expiry, decision)
+        self._decision_cache = {}
     
     def run(self, analysis_results, market_data, account_data, positions, memory):
         """Run the executor agent to make trading decisions"""
@@ -28,7 +48,29 @@ class ExecutorAgent:
             if not analysis_results:
                 logger.warning("No analysis results for execution")
                 return None
-            
+
+            # Reuse a recent decision if the trading picture is unchanged,
+            # skipping the LLM call entirely. The digest covers the open
+            # dealIds and rounded balance as well as the analysis, so a
+            # closed position or balance change invalidates the entry.
+            open_deal_ids = []
+            if not positions.empty:
+                open_deal_ids = sorted(positions["dealId"].tolist())
+            digest = hashlib.sha256(orjson.dumps({
+                "analysis": analysis_results,
+                "open_deal_ids": open_deal_ids,
+                "balance": round(float(account_data.get("balance") or 0), 2)
+            }, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+            cached = self._decision_cache.get(digest)
+            if cached and cached[0] > time.time():
+                # Flag the hit so the controller does not re-submit the
+                # same trade and position actions to IG
+                logger.info("Executor reusing cached decision for unchanged analysis")
+                hit = dict(cached[1])
+                hit["from_cache"] = True
+                return hit
+
             # Get recent trades and trade history
             recent_trades = memory.get_recent_trades(5)
             all_trades = memory.get_all_trades()
@@ -61,7 +103,16 @@ class ExecutorAgent:
                 
                 # Save response for logging
                 self._save_response(result)
-                
+
+                # Cache the decision against this analysis digest. Drop
+                # expired entries before inserting to keep the cache bounded
+                now = time.time()
+                if len(self._decision_cache) >= DECISION_CACHE_MAX_ENTRIES:
+                    self._decision_cache = {
+                        k: v for k, v in self._decision_cache.items() if v[0] > now
+                    }
+                self._decision_cache[digest] = (now + DECISION_CACHE_TTL, result)
+
                 return result
             else:
                 logger.warning("Executor agent produced no result")
@@ -82,53 +133,72 @@ class ExecutorAgent:
                     {"role": "user", "content": prompt}
                 ],
                 "temperature": 0.3,
-                "response_format": {"type": "json_object"}
+                "response_format": {"type": "json_object"},
+                "stream": True,
+                "stream_options": {"include_usage": True}
             }
-            
-            # Call API
-            response = openai.chat.completions.create(**params)
-            
+
+            # Set a timeout to avoid hanging
+            timeout = int(os.getenv("OPENAI_API_REQUEST_TIMEOUT", "60"))
+
+            # Call API and assemble the streamed response as chunks arrive
+            response = call_with_retries(
+                openai.chat.completions.create,
+                description="Executor LLM call",
+                retryable=(
+                    openai.APITimeoutError,
+                    openai.APIConnectionError,
+                    openai.RateLimitError,
+                    openai.InternalServerError
+                ),
+                timeout=timeout,
+                **params
+            )
+
+            buf = []
+            usage = None
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    buf.append(chunk.choices[0].delta.content)
+                # The final chunk carries usage when include_usage is set
+                if chunk.usage:
+                    usage = chunk.usage
+
             # Log usage
-            usage = response.usage
-            tokens_in = usage.prompt_tokens
-            tokens_out = usage.completion_tokens
-            cost = self._calculate_cost(tokens_in, tokens_out)
-            self.budget_manager.log_usage("executor", tokens_in, tokens_out, cost)
-            
-            # Parse response
-            result = response.choices[0].message.content
+            if usage:
+                tokens_in = usage.prompt_tokens
+                tokens_out = usage.completion_tokens
+                cost = self._calculate_cost(tokens_in, tokens_out)
+                self.budget_manager.log_usage("executor", tokens_in, tokens_out, cost)
+
+            # Parse response - json_object mode guarantees valid JSON
+            result = "".join(buf)
             try:
-                return json.loads(result)
-            except json.JSONDecodeError:
-                # Try to extract JSON if wrapped in code blocks
-                import re
-                json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', result)
-                if json_match:
-                    try:
-                        return json.loads(json_match.group(1))
-                    except:
-                        logger.error("Failed to parse JSON from response")
-                        return None
-                else:
-                    logger.error("Failed to extract JSON from response")
-                    return None
-                    
+                return orjson.loads(result)
+            except orjson.JSONDecodeError:
+                logger.error("Failed to parse JSON from response")
+                return None
+
         except Exception as e:
             logger.error(f"LLM API error: {e}")
             return None
     
     def _calculate_cost(self, tokens_in, tokens_out):
         """Calculate cost of API call"""
-        # GPT-4 pricing
-        return (tokens_in * 0.03 + tokens_out * 0.06) / 1000
+        rate_in, rate_out = MODEL_PRICING[self.model]
+        return (tokens_in * rate_in + tokens_out * rate_out) / 1000
     
     def _save_response(self, result):
         """Save response to log file"""
         try:
-            with open(f"data/executor_results.jsonl", "a") as f:
-                f.write(json.dumps({
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "result": result
-                }) + "\n")
+            # Open the log once and keep the handle for later writes
+            if self._results_file is None or self._results_file.closed:
+                self._results_file = open("data/executor_results.jsonl", "ab")
+
+            self._results_file.write(orjson.dumps({
+                "timestamp": time.time(),
+                "result": result
+            }) + b"\n")
+            self._results_file.flush()
         except Exception as e:
             logger.error(f"Error saving executor result: {e}")
\ No newline at end of file
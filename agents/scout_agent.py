@@ -5,9 +5,11 @@ Identifies trading opportunities and maintains market awareness
 
 import logging
 import json
-from datetime import datetime, timezone
+import os
+import time
 import openai
 from prompts.collaborative_trading_prompts import CollaborativeTradingPrompts
+from utils.retry import call_with_retries
 
 logger = logging.getLogger("CollaborativeTrader")
 
@@ -81,13 +83,23 @@ class ScoutAgent:
             }
             
             # Set a timeout to avoid hanging
-            import os
             timeout = int(os.getenv("OPENAI_API_REQUEST_TIMEOUT", "60"))
             
             # Call API with error handling for platform detection issues
             try:
                 # Call API
-                response = openai.chat.completions.create(**params, timeout=timeout)
+                response = call_with_retries(
+                    openai.chat.completions.create,
+                    description="Scout LLM call",
+                    retryable=(
+                        openai.APITimeoutError,
+                        openai.APIConnectionError,
+                        openai.RateLimitError,
+                        openai.InternalServerError
+                    ),
+                    timeout=timeout,
+                    **params
+                )
             except Exception as platform_error:
                 # Handle platform detection errors by temporarily modifying environment
                 import platform as py_platform
@@ -122,13 +134,17 @@ class ScoutAgent:
             try:
                 return json.loads(result)
             except json.JSONDecodeError:
-                # Try to extract JSON if wrapped in code blocks
-                import re
-                json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', result)
-                if json_match:
+                # Try to extract JSON if wrapped in code blocks, using a
+                # plain fence scan instead of a backtracking regex
+                start = result.find("```")
+                end = result.rfind("```")
+                if start != -1 and end > start:
+                    block = result[start + 3:end]
+                    if block.startswith("json"):
+                        block = block[4:]
                     try:
-                        return json.loads(json_match.group(1))
-                    except:
+                        return json.loads(block.strip())
+                    except json.JSONDecodeError:
                         logger.error("Failed to parse JSON from response")
                         return None
                 else:
@@ -149,7 +165,7 @@ class ScoutAgent:
         try:
             with open(f"data/scout_results.jsonl", "a") as f:
                 f.write(json.dumps({
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": time.time(),
                     "result": result
                 }) + "\n")
         except Exception as e:
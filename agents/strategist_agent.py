@@ -5,9 +5,11 @@ Performs deep technical analysis and trading plan development
 
 import logging
 import json
-from datetime import datetime, timezone
+import os
+import time
 import openai
 from prompts.collaborative_trading_prompts import CollaborativeTradingPrompts
+from utils.retry import call_with_retries
 
 logger = logging.getLogger("CollaborativeTrader")
 
@@ -15,8 +17,8 @@ class StrategistAgent:
     """Strategist Agent that performs technical analysis"""
     
     def __init__(self, budget_manager):
-        self.model = "gpt-4-turbo-preview"
-        self.cost_estimate = 0.50
+        self.model = "gpt-4o-mini"
+        self.cost_estimate = 0.05
         self.budget_manager = budget_manager
     
     def run(self, opportunities, market_data, account_data, positions, memory):
@@ -84,13 +86,23 @@ class StrategistAgent:
             }
             
             # Set a timeout to avoid hanging
-            import os
             timeout = int(os.getenv("OPENAI_API_REQUEST_TIMEOUT", "60"))
             
             # Call API with error handling for platform detection issues
             try:
                 # Call API
-                response = openai.chat.completions.create(**params, timeout=timeout)
+                response = call_with_retries(
+                    openai.chat.completions.create,
+                    description="Strategist LLM call",
+                    retryable=(
+                        openai.APITimeoutError,
+                        openai.APIConnectionError,
+                        openai.RateLimitError,
+                        openai.InternalServerError
+                    ),
+                    timeout=timeout,
+                    **params
+                )
             except Exception as platform_error:
                 # Handle platform detection errors by temporarily modifying environment
                 import platform as py_platform
@@ -125,13 +137,17 @@ class StrategistAgent:
             try:
                 return json.loads(result)
             except json.JSONDecodeError:
-                # Try to extract JSON if wrapped in code blocks
-                import re
-                json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', result)
-                if json_match:
+                # Try to extract JSON if wrapped in code blocks, using a
+                # plain fence scan instead of a backtracking regex
+                start = result.find("```")
+                end = result.rfind("```")
+                if start != -1 and end > start:
+                    block = result[start + 3:end]
+                    if block.startswith("json"):
+                        block = block[4:]
                     try:
-                        return json.loads(json_match.group(1))
-                    except:
+                        return json.loads(block.strip())
+                    except json.JSONDecodeError:
                         logger.error("Failed to parse JSON from response")
                         return None
                 else:
@@ -144,15 +160,15 @@ class StrategistAgent:
     
     def _calculate_cost(self, tokens_in, tokens_out):
         """Calculate cost of API call"""
-        # GPT-4 pricing
-        return (tokens_in * 0.03 + tokens_out * 0.06) / 1000
+        # GPT-4o mini pricing
+        return (tokens_in * 0.00015 + tokens_out * 0.0006) / 1000
     
     def _save_response(self, result):
         """Save response to log file"""
         try:
             with open(f"data/strategist_results.jsonl", "a") as f:
                 f.write(json.dumps({
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": time.time(),
                     "result": result
                 }) + "\n")
         except Exception as e:
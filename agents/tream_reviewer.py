@@ -5,9 +5,12 @@ Coordinates agent communication and improves system performance
 
 import logging
 import json
+import os
+import time
 from datetime import datetime, timezone
 import openai
 from prompts.collaborative_trading_prompts import CollaborativeTradingPrompts
+from utils.retry import call_with_retries
 
 logger = logging.getLogger("CollaborativeTrader")
 
@@ -15,8 +18,8 @@ class TeamReviewer:
     """Team Review Agent that coordinates the trading team"""
     
     def __init__(self, budget_manager):
-        self.model = "gpt-4-turbo-preview"
-        self.cost_estimate = 0.40
+        self.model = "gpt-4o-mini"
+        self.cost_estimate = 0.04
         self.budget_manager = budget_manager
     
     def run(self, agent_responses, market_data, account_data, positions, memory):
@@ -69,7 +72,8 @@ class TeamReviewer:
                     requests = result["requests_for_human"]
                     logger.info(f"Requests for human operator: {requests}")
                     
-                    # Save to a dedicated file for the human to review
+                    # Save to a dedicated file for the human to review,
+                    # keeping the human-readable ISO timestamp
                     with open("data/human_requests.jsonl", "a") as f:
                         f.write(json.dumps({
                             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -102,8 +106,22 @@ class TeamReviewer:
                 "response_format": {"type": "json_object"}
             }
             
+            # Set a timeout to avoid hanging
+            timeout = int(os.getenv("OPENAI_API_REQUEST_TIMEOUT", "60"))
+
             # Call API
-            response = openai.chat.completions.create(**params)
+            response = call_with_retries(
+                openai.chat.completions.create,
+                description="Team review LLM call",
+                retryable=(
+                    openai.APITimeoutError,
+                    openai.APIConnectionError,
+                    openai.RateLimitError,
+                    openai.InternalServerError
+                ),
+                timeout=timeout,
+                **params
+            )
             
             # Log usage
             usage = response.usage
@@ -117,13 +135,17 @@ class TeamReviewer:
             try:
                 return json.loads(result)
             except json.JSONDecodeError:
-                # Try to extract JSON if wrapped in code blocks
-                import re
-                json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', result)
-                if json_match:
+                # Try to extract JSON if wrapped in code blocks, using a
+                # plain fence scan instead of a backtracking regex
+                start = result.find("```")
+                end = result.rfind("```")
+                if start != -1 and end > start:
+                    block = result[start + 3:end]
+                    if block.startswith("json"):
+                        block = block[4:]
                     try:
-                        return json.loads(json_match.group(1))
-                    except:
+                        return json.loads(block.strip())
+                    except json.JSONDecodeError:
                         logger.error("Failed to parse JSON from response")
                         return None
                 else:
@@ -136,15 +158,15 @@ class TeamReviewer:
     
     def _calculate_cost(self, tokens_in, tokens_out):
         """Calculate cost of API call"""
-        # GPT-4 pricing
-        return (tokens_in * 0.03 + tokens_out * 0.06) / 1000
+        # GPT-4o mini pricing
+        return (tokens_in * 0.00015 + tokens_out * 0.0006) / 1000
     
     def _save_response(self, result):
         """Save response to log file"""
         try:
             with open(f"data/team_review_results.jsonl", "a") as f:
                 f.write(json.dumps({
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": time.time(),
                     "result": result
                 }) + "\n")
         except Exception as e:
@@ -5,6 +5,7 @@ Tracks and controls API usage costs
 
 import os
 import json
+import time
 from datetime import datetime, timezone
 
 
@@ -42,7 +43,7 @@ class LLMBudgetManager:
             "tokens_in": tokens_in,
             "tokens_out": tokens_out,
             "cost": cost,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": time.time()
         })
         
         # Save to file
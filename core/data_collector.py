@@ -3,30 +3,81 @@ Data Collection Module
 Handles market and account data collection from trading APIs
 """
 
+import asyncio
 import logging
+import os
+import httpx
+import orjson
+import requests
 import pandas as pd
 from datetime import datetime, timezone, timedelta
 
+from utils.retry import call_with_retries
+
 logger = logging.getLogger("CollaborativeTrader")
 
+POLYGON_BASE_URL = "https://api.polygon.io"
+
+# Cap concurrent Polygon requests to stay inside rate limits
+MAX_CONCURRENT_REQUESTS = 10
+
+# The shared IGService session is not thread-safe and IG rate-limits
+# non-trading requests, so snapshot calls are serialized
+MAX_CONCURRENT_IG_REQUESTS = 1
+
+# Cache TTLs for aggregate bar windows. Windows that include today still
+# have a forming bar, so they expire quickly; fully closed windows are
+# immutable and can live much longer.
+AGGS_CACHE_TTL = 60
+AGGS_CACHE_TTL_CLOSED = 3600
+AGGS_CACHE_MAX_ENTRIES = 256
+
+# Default bar timeframes collected per instrument
+DEFAULT_TIMEFRAMES = {
+    "m15": {"timeframe": "15:minute", "lookback_days": 1},
+    "h1": {"timeframe": "hour", "lookback_days": 2},
+    "h4": {"timeframe": "4:hour", "lookback_days": 5}
+}
+
+# IG epic -> Polygon ticker
+TICKER_MAP = {
+    "CS.D.EURUSD.TODAY.IP": "C:EURUSD",
+    "CS.D.USDJPY.TODAY.IP": "C:USDJPY",
+    "CS.D.GBPUSD.TODAY.IP": "C:GBPUSD",
+    "CS.D.AUDUSD.TODAY.IP": "C:AUDUSD",
+    "CS.D.USDCAD.TODAY.IP": "C:USDCAD",
+    "CS.D.USDCHF.TODAY.IP": "C:USDCHF",
+    "CS.D.NZDUSD.TODAY.IP": "C:NZDUSD",
+    "CS.D.EURJPY.TODAY.IP": "C:EURJPY",
+    "CS.D.EURGBP.TODAY.IP": "C:EURGBP",
+    "CS.D.GBPJPY.TODAY.IP": "C:GBPJPY",
+    "CS.D.AUDJPY.TODAY.IP": "C:AUDJPY",
+    "CS.D.AUDNZD.TODAY.IP": "C:AUDNZD"
+}
+
 class DataCollector:
     """Collects market and account data"""
     
-    def __init__(self, ig_service, polygon_client):
+    def __init__(self, ig_service):
         self.ig = ig_service
-        self.polygon = polygon_client
+        # (ticker, multiplier, timespan, start, end) -> (expiry, bars)
+        self._aggs_cache = {}
     
     def get_account_data(self):
         """Get account information"""
         try:
-            import os
-            accounts = self.ig.fetch_accounts()
+            accounts = call_with_retries(
+                self.ig.fetch_accounts, description="IG fetch_accounts",
+                retryable=(requests.ConnectionError, requests.Timeout)
+            )
             if os.getenv("IG_ACCOUNT_ID"):
                 account = accounts[accounts['accountId'] == os.getenv("IG_ACCOUNT_ID")]
             else:
-                account = accounts.iloc[[0]]
-            
-            return account.iloc[0].to_dict()
+                account = accounts
+
+            # itertuples avoids the Series materialization of iloc[0].to_dict()
+            row = next(account.itertuples(index=False), None)
+            return row._asdict() if row is not None else {}
         except Exception as e:
             logger.error(f"Error getting account: {e}")
             return {}
@@ -34,47 +85,89 @@ class DataCollector:
     def get_positions(self):
         """Get open positions"""
         try:
-            return self.ig.fetch_open_positions()
+            return call_with_retries(
+                self.ig.fetch_open_positions, description="IG fetch_open_positions",
+                retryable=(requests.ConnectionError, requests.Timeout)
+            )
         except Exception as e:
             logger.error(f"Error getting positions: {e}")
             return pd.DataFrame()
     
-    def get_market_data(self, epic, timeframes=None):
+    async def _fetch_aggs(self, client, semaphore, ticker, multiplier, timespan, start, end):
+        """Fetch aggregate bars for one (ticker, timeframe) from Polygon"""
+        start_date = start.strftime("%Y-%m-%d")
+        end_date = end.strftime("%Y-%m-%d")
+
+        # Reuse recently fetched windows instead of re-downloading them
+        cache_key = (ticker, multiplier, timespan, start_date, end_date)
+        now = datetime.now(timezone.utc).timestamp()
+        cached = self._aggs_cache.get(cache_key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        url = (
+            f"{POLYGON_BASE_URL}/v2/aggs/ticker/{ticker}/range/"
+            f"{multiplier}/{timespan}/{start_date}/{end_date}"
+        )
+        params = {
+            "limit": 100,
+            "sort": "asc",
+            "apiKey": os.getenv("POLYGON_API_KEY")
+        }
+
+        async with semaphore:
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            bars = orjson.loads(response.content).get("results") or []
+
+        today = datetime.now(timezone.utc).date().isoformat()
+        ttl = AGGS_CACHE_TTL if end_date >= today else AGGS_CACHE_TTL_CLOSED
+
+        # Drop expired entries before inserting to keep the cache bounded
+        if len(self._aggs_cache) >= AGGS_CACHE_MAX_ENTRIES:
+            self._aggs_cache = {
+                k: v for k, v in self._aggs_cache.items() if v[0] > now
+            }
+        self._aggs_cache[cache_key] = (now + ttl, bars)
+
+        return bars
+
+    async def _fetch_snapshot(self, epic, ig_semaphore):
+        """Fetch the IG price snapshot without overlapping other IG calls"""
+        async with ig_semaphore:
+            return await asyncio.to_thread(self.get_price_snapshot, epic)
+
+    async def get_market_data(self, epic, timeframes=None, client=None,
+                              semaphore=None, ig_semaphore=None):
         """Collect market data for an instrument"""
         if timeframes is None:
-            timeframes = {
-                "m15": {"timeframe": "15:minute", "lookback_days": 1},
-                "h1": {"timeframe": "hour", "lookback_days": 2},
-                "h4": {"timeframe": "4:hour", "lookback_days": 5}
-            }
-        
+            timeframes = DEFAULT_TIMEFRAMES
+
         # Convert IG epic to Polygon ticker
-        ticker_map = {
-            "CS.D.EURUSD.TODAY.IP": "C:EURUSD",
-            "CS.D.USDJPY.TODAY.IP": "C:USDJPY",
-            "CS.D.GBPUSD.TODAY.IP": "C:GBPUSD",
-            "CS.D.AUDUSD.TODAY.IP": "C:AUDUSD",
-            "CS.D.USDCAD.TODAY.IP": "C:USDCAD",
-            "CS.D.USDCHF.TODAY.IP": "C:USDCHF",
-            "CS.D.NZDUSD.TODAY.IP": "C:NZDUSD",
-            "CS.D.EURJPY.TODAY.IP": "C:EURJPY",
-            "CS.D.EURGBP.TODAY.IP": "C:EURGBP",
-            "CS.D.GBPJPY.TODAY.IP": "C:GBPJPY",
-            "CS.D.AUDJPY.TODAY.IP": "C:AUDJPY",
-            "CS.D.AUDNZD.TODAY.IP": "C:AUDNZD"
-        }
-        
-        ticker = ticker_map.get(epic)
+        ticker = TICKER_MAP.get(epic)
         if not ticker:
             return {}
-        
+
+        # Allow standalone use without shared clients/semaphores
+        if client is None:
+            async with httpx.AsyncClient(timeout=30) as own_client:
+                return await self.get_market_data(
+                    epic, timeframes, own_client,
+                    asyncio.Semaphore(MAX_CONCURRENT_REQUESTS),
+                    asyncio.Semaphore(MAX_CONCURRENT_IG_REQUESTS)
+                )
+
         results = {}
-        
+
         try:
+            keys = []
+            tasks = []
+            end = datetime.now(timezone.utc)
+
             for key, config in timeframes.items():
                 timeframe = config["timeframe"]
                 lookback_days = config["lookback_days"]
-                
+
                 # Parse timeframe
                 if ":" in timeframe:
                     parts = timeframe.split(":")
@@ -83,49 +176,69 @@ class DataCollector:
                 else:
                     multiplier = 1
                     timespan = timeframe
-                
-                # Get data from Polygon
-                end = datetime.now(timezone.utc)
+
                 start = end - timedelta(days=lookback_days)
-                
-                aggs = self.polygon.get_aggs(
-                    ticker=ticker,
-                    multiplier=multiplier,
-                    timespan=timespan,
-                    from_=start.strftime("%Y-%m-%d"),
-                    to=end.strftime("%Y-%m-%d"),
-                    limit=100
-                )
-                
+                keys.append(key)
+                tasks.append(self._fetch_aggs(
+                    client, semaphore, ticker, multiplier, timespan, start, end
+                ))
+
+            # Fan out all timeframe fetches and the blocking IG snapshot together
+            snapshot_task = self._fetch_snapshot(epic, ig_semaphore)
+            *aggs_per_key, snapshot = await asyncio.gather(*tasks, snapshot_task)
+
+            for key, aggs in zip(keys, aggs_per_key):
                 if not aggs:
                     continue
-                
-                # Convert to standardized format
-                data = [{
-                    "timestamp": datetime.fromtimestamp(a.timestamp/1000, tz=timezone.utc).isoformat(),
-                    "open": a.open,
-                    "high": a.high,
-                    "low": a.low,
-                    "close": a.close,
-                    "volume": a.volume
-                } for a in aggs]
-                
-                results[key] = data
-            
+
+                # Convert to standardized format with vectorized pandas ops
+                # instead of per-bar datetime/isoformat calls
+                df = pd.DataFrame(aggs)
+                df = df.rename(columns={
+                    "t": "timestamp",
+                    "o": "open",
+                    "h": "high",
+                    "l": "low",
+                    "c": "close",
+                    "v": "volume"
+                })
+                df["timestamp"] = pd.to_datetime(
+                    df["timestamp"], unit="ms", utc=True
+                ).dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+                columns = ["timestamp", "open", "high", "low", "close", "volume"]
+                results[key] = df[columns].to_dict(orient="records")
+
             # Add current price snapshot
-            snapshot = self.get_price_snapshot(epic)
             if snapshot:
                 results["current"] = snapshot
-                
+
             return results
         except Exception as e:
             logger.error(f"Error collecting market data for {epic}: {e}")
             return {}
+
+    async def get_market_data_many(self, epics, timeframes=None):
+        """Collect market data for several instruments concurrently"""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        ig_semaphore = asyncio.Semaphore(MAX_CONCURRENT_IG_REQUESTS)
+
+        async with httpx.AsyncClient(timeout=30) as client:
+            results = await asyncio.gather(*[
+                self.get_market_data(epic, timeframes, client, semaphore, ig_semaphore)
+                for epic in epics
+            ])
+
+        return {epic: data for epic, data in zip(epics, results) if data}
     
     def get_price_snapshot(self, epic):
         """Get current market price snapshot"""
         try:
-            response = self.ig.fetch_market_by_epic(epic)
+            response = call_with_retries(
+                self.ig.fetch_market_by_epic, epic,
+                description="IG fetch_market_by_epic",
+                retryable=(requests.ConnectionError, requests.Timeout)
+            )
             if response and 'snapshot' in response:
                 snapshot = response['snapshot']
                 
@@ -3,8 +3,10 @@ System Controller Module
 Orchestrates the trading system components and workflow
 """
 
+import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import openai
 import os
@@ -37,14 +39,14 @@ FOREX_PAIRS = [
 class SystemController:
     """Controls the collaborative trading system workflow"""
     
-    def __init__(self, ig_service, polygon_client):
+    def __init__(self, ig_service):
         # Set up OpenAI API
         openai.api_key = os.getenv("OPENAI_API_KEY")
         
         # Initialize components
         self.budget = LLMBudgetManager()
         self.memory = TradingMemory()
-        self.data = DataCollector(ig_service, polygon_client)
+        self.data = DataCollector(ig_service)
         
         # Initialize agents
         self.scout = ScoutAgent(self.budget)
@@ -73,8 +75,14 @@ class SystemController:
                 logger.warning("No executor result to implement")
                 return False
             
-            # Get current positions
+            # Get current positions, indexed by deal for O(1) lookups
             positions = self.data.get_positions()
+            positions_by_deal = {}
+            if not positions.empty:
+                positions_by_deal = {
+                    row.dealId: row._asdict()
+                    for row in positions.itertuples(index=False)
+                }
             
             # Execute new trades
             trade_actions = executor_result.get("trade_actions", [])
@@ -106,7 +114,7 @@ class SystemController:
                 action_type = action.get("action_type", "").upper()
                 
                 if action_type == "CLOSE":
-                    success, result = close_position(self.ig, action, positions)
+                    success, result = close_position(self.ig, action, positions_by_deal)
                     if success:
                         logger.info(f"Successfully closed position: {action.get('epic')} {action.get('dealId')}")
                         # Log the close
@@ -153,12 +161,8 @@ class SystemController:
             account_data = self.data.get_account_data()
             positions = self.data.get_positions()
             
-            # Collect market data for all pairs
-            market_data = {}
-            for epic in FOREX_PAIRS:
-                data = self.data.get_market_data(epic)
-                if data:
-                    market_data[epic] = data
+            # Collect market data for all pairs concurrently
+            market_data = asyncio.run(self.data.get_market_data_many(FOREX_PAIRS))
             
             # 1. Run Market Scout Agent
             scout_result = self.scout.run(
@@ -205,22 +209,40 @@ class SystemController:
                             
                             if executor_result:
                                 self.agent_responses["executor"] = executor_result
-                                
-                                # 4. Execute trading actions
-                                self.execute_trading_actions(executor_result)
-                
-                # 5. Run team review if all agents produced results
-                if all(self.agent_responses.values()):
-                    team_result = self.team_reviewer.run(
-                        self.agent_responses,
-                        market_data, 
-                        account_data, 
-                        positions, 
-                        self.memory
-                    )
-                    
-                    if team_result:
-                        self.agent_responses["team_review"] = team_result
+
+                                # 4 & 5. Trade execution and the team review
+                                # both depend only on the executor output, so
+                                # run them concurrently instead of back to back
+                                core_responses = {
+                                    k: v for k, v in self.agent_responses.items()
+                                    if k != "team_review"
+                                }
+
+                                with ThreadPoolExecutor(max_workers=2) as pool:
+                                    # A cached executor decision was already
+                                    # acted on - never re-submit it to IG
+                                    actions_future = None
+                                    if executor_result.get("from_cache"):
+                                        logger.info("Skipping trade execution for cached executor decision")
+                                    else:
+                                        actions_future = pool.submit(
+                                            self.execute_trading_actions, executor_result
+                                        )
+                                    review_future = pool.submit(
+                                        self.team_reviewer.run,
+                                        core_responses,
+                                        market_data,
+                                        account_data,
+                                        positions,
+                                        self.memory
+                                    )
+
+                                    if actions_future:
+                                        actions_future.result()
+                                    team_result = review_future.result()
+
+                                if team_result:
+                                    self.agent_responses["team_review"] = team_result
             
             # Log budget status
             budget_status = self.budget.get_status()
@@ -6,6 +6,7 @@ Manages persistence of trading history, analysis and system state
 import os
 import json
 import logging
+import orjson
 from datetime import datetime, timezone
 
 logger = logging.getLogger("CollaborativeTrader")
@@ -162,8 +163,8 @@ class TradingMemory:
                 self.save_analysis_history()
         
         # Save trade to log
-        with open(self.trade_log_file, "a") as f:
-            f.write(json.dumps(trade_data) + "\n")
+        with open(self.trade_log_file, "ab") as f:
+            f.write(orjson.dumps(trade_data) + b"\n")
             
         # Update memory
         self.memory["last_updated"] = datetime.now(timezone.utc).isoformat()
@@ -176,7 +177,7 @@ class TradingMemory:
             if os.path.exists(self.trade_log_file):
                 with open(self.trade_log_file, "r") as f:
                     for line in f:
-                        trades.append(json.loads(line))
+                        trades.append(orjson.loads(line))
                 
                 # Sort by timestamp (newest first) and limit
                 trades.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
@@ -193,7 +194,7 @@ class TradingMemory:
             if os.path.exists(self.trade_log_file):
                 with open(self.trade_log_file, "r") as f:
                     for line in f:
-                        trades.append(json.loads(line))
+                        trades.append(orjson.loads(line))
                 
                 # Sort by timestamp (newest first)
                 trades.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
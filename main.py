@@ -6,7 +6,7 @@ Main entry point
 import os
 import logging
 from dotenv import load_dotenv
-from utils.api_connectors import get_ig_service, get_polygon_client
+from utils.api_connectors import get_ig_service
 from core.system_controller import SystemController
 
 # Setup
@@ -29,14 +29,13 @@ def main():
     
     # Connect to trading APIs
     ig_service = get_ig_service()
-    polygon_client = get_polygon_client()
     
     if not ig_service:
         logger.error("Failed to connect to IG API. Exiting.")
         return
     
     # Initialize and run the system
-    system = SystemController(ig_service, polygon_client)
+    system = SystemController(ig_service)
     system.run()
 
 if __name__ == "__main__":
@@ -1,5 +1,162 @@
 # collaborative_trading_prompts.py - Advanced prompts for collaborative LLM forex trading agents
 
+from datetime import datetime
+
+# Static response-format sections, built once at import time. Raw strings
+# avoid f-string formatting issues with the literal braces in the examples.
+MARKET_SCANNER_RESPONSE_FORMAT = r"""
+## Response Format
+Respond with a JSON object containing:
+1. "market_assessment" with:
+   - "overall_condition": "trending/ranging/volatile/uncertain"
+   - "overall_bias": "bullish/bearish/neutral"
+   - "correlations": [key currency correlations you've identified]
+   - "summary": "Brief 1-2 sentence market summary"
+
+2. "opportunities" array with the best trading setups:
+   - "epic": Currency pair code
+   - "pattern": Specific pattern identified
+   - "direction": "BUY" or "SELL"
+   - "conviction": Rating from 1-10
+   - "timeframe": "short-term/medium-term/long-term"
+   - "reasoning": Detailed explanation of the opportunity
+   - "key_levels": Important price levels to watch
+
+3. "self_improvement":
+   - "pattern_effectiveness": Assessment of which patterns have worked best
+   - "questions_for_team": Questions for other agents about what information would help you
+   - "suggestions": Ideas to improve the overall trading system
+"""
+
+ANALYSIS_ENGINE_RESPONSE_FORMAT = r"""
+## Response Format
+Respond with a JSON object containing:
+1. "analysis_results" array with detailed analysis for each pair:
+   - "epic": Currency pair code
+   - "direction": "BUY" or "SELL"
+   - "analysis_quality": Rating from 1-10
+   - "entry_zone": {"ideal": price, "range_low": price, "range_high": price}
+   - "stop_loss": {"price": level, "pips": distance, "reasoning": explanation}
+   - "take_profit": [{"level": price, "pips": distance, "probability": confidence}]
+   - "risk_reward": Calculated R:R ratio
+   - "position_size_recommendation": Percentage of account or lot size
+   - "trading_plan": Detailed explanation of the setup and execution
+   - "key_indicators": Important technical indicators supporting the trade
+
+2. "market_insights": Overall insights from your analysis
+
+3. "self_improvement":
+   - "analysis_effectiveness": Assessment of your previous analyses
+   - "questions_for_team": Questions for other agents that would help you
+   - "suggestions": Ideas to improve your analysis approach
+"""
+
+DECISION_MAKER_RESPONSE_FORMAT = r"""
+## Response Format
+Respond with a JSON object containing:
+1. "trade_actions" array with specific trades to execute:
+   - "action_type": "OPEN"
+   - "epic": Currency pair code
+   - "direction": "BUY" or "SELL"
+   - "size": Position size
+   - "entry_price": Ideal entry price
+   - "entry_range": [lower, upper] range for entry
+   - "initial_stop_loss": Initial stop loss level
+   - "take_profit_levels": [level1, level2, ...]
+   - "risk_percent": Percentage of account risked
+   - "risk_reward": Expected R:R ratio
+   - "pattern": Pattern being traded
+   - "stop_management": [{"type": "strategy", "settings": {"specific": "settings"}}]
+   - "reasoning": Detailed reasoning for this execution decision
+
+2. "position_actions" array with actions for existing positions:
+   - "action_type": "CLOSE", "UPDATE_STOP", "TAKE_PARTIAL"
+   - "epic": Currency pair code
+   - "dealId": Deal identifier
+   - "new_level": New level for stop or take profit
+   - "percentage": Percentage to close (for partial)
+   - "reason": Explanation for the action
+
+3. "portfolio_assessment":
+   - "current_exposure": Overall market exposure assessment
+   - "risk_distribution": How risk is spread across positions
+   - "correlation_management": How you're managing correlations
+   - "progress_to_daily_goal": Assessment of progress toward 10% target
+
+4. "self_improvement":
+   - "execution_effectiveness": Assessment of your decision making
+   - "questions_for_team": Questions for other agents that would help you
+   - "suggestions": Ideas to improve execution approach
+   - "needs_from_user": What you need from the human trader to improve
+"""
+
+TEAM_REVIEW_RESPONSE_FORMAT = r"""
+## Response Format
+Respond with a JSON object containing:
+1. "team_assessment":
+   - "coordination_quality": Rating from 1-10
+   - "progress_to_goal": Assessment of progress toward 10% daily target
+   - "key_strengths": What's working well
+   - "key_weaknesses": Areas needing improvement
+
+2. "agent_feedback":
+   - "scout": Specific feedback and advice for the scout
+   - "strategist": Specific feedback and advice for the strategist
+   - "executor": Specific feedback and advice for the executor
+
+3. "strategy_adjustments":
+   - "risk_management": Suggested changes to risk approach
+   - "pair_selection": Suggested changes to market focus
+   - "technical_approach": Suggested changes to analysis methods
+
+4. "requests_for_human":
+   - Specific questions or requests for the human operator
+"""
+
+POSITION_MANAGER_RESPONSE_FORMAT = r"""
+## Response Format
+Respond with a JSON object containing:
+1. "position_actions" array with actions for each position:
+   - "action_type": "CLOSE", "UPDATE_STOP", "TAKE_PARTIAL", "NO_CHANGE"
+   - "epic": Currency pair code
+   - "dealId": Deal identifier
+   - "new_level": New level for stop (if applicable)
+   - "percentage": Percentage to close (if applicable)
+   - "reason": Detailed reasoning for this action
+
+2. "risk_assessment":
+   - "overall_portfolio_risk": Assessment of current risk level
+   - "primary_threats": Main risks to current positions
+   - "recommended_adjustments": General portfolio adjustment recommendations
+"""
+
+SYSTEM_OPTIMIZER_RESPONSE_FORMAT = r"""
+## Response Format
+Respond with a JSON object containing:
+1. "system_assessment":
+   - "overall_performance": Rating from 1-10
+   - "progress_to_goal": Assessment of progress toward 10% daily target
+   - "key_strengths": What's working well
+   - "key_weaknesses": Areas needing improvement
+
+2. "optimization_recommendations":
+   - "budget_allocation": {"scout": percentage, "strategist": percentage, "executor": percentage}
+   - "risk_parameters": {"base_risk": percentage, "risk_multiplier": factor}
+   - "pattern_focus": Array of most effective patterns to prioritize
+   - "timeframe_focus": Most effective timeframes to focus on
+
+3. "process_improvements":
+   - "scout_recommendations": Specific improvements for the scout agent
+   - "strategist_recommendations": Specific improvements for the strategist agent
+   - "executor_recommendations": Specific improvements for the executor agent
+
+4. "technical_improvements":
+   - Specific technical enhancements to the system
+   - Data sources that would improve decision making
+   - Algorithmic improvements to consider
+"""
+
+
 class CollaborativeTradingPrompts:
     """Advanced prompt templates for a team of 3 collaborative trading agents"""
     
@@ -106,33 +263,8 @@ Your specific responsibilities are:
 Reflect on past trade performance from the logs. How can you improve your opportunity identification? What patterns have been working? What information would help you make better recommendations?
 """
         
-        # Use raw string for response format to avoid f-string formatting issues
-        response_format = r"""
-## Response Format
-Respond with a JSON object containing:
-1. "market_assessment" with:
-   - "overall_condition": "trending/ranging/volatile/uncertain"
-   - "overall_bias": "bullish/bearish/neutral"
-   - "correlations": [key currency correlations you've identified]
-   - "summary": "Brief 1-2 sentence market summary"
-
-2. "opportunities" array with the best trading setups:
-   - "epic": Currency pair code
-   - "pattern": Specific pattern identified
-   - "direction": "BUY" or "SELL"
-   - "conviction": Rating from 1-10
-   - "timeframe": "short-term/medium-term/long-term"
-   - "reasoning": Detailed explanation of the opportunity
-   - "key_levels": Important price levels to watch
-
-3. "self_improvement":
-   - "pattern_effectiveness": Assessment of which patterns have worked best
-   - "questions_for_team": Questions for other agents about what information would help you
-   - "suggestions": Ideas to improve the overall trading system
-"""
-
-        # Combine main prompt with response format
-        return main_prompt + response_format
+        # Combine main prompt with the pre-built static response format
+        return main_prompt + MARKET_SCANNER_RESPONSE_FORMAT
 
     @staticmethod
     def analysis_engine(opportunities, market_data, account_data, positions, system_memory, previous_analyses=None):
@@ -152,7 +284,6 @@ Respond with a JSON object containing:
                 if "h1" in data and data["h1"]:
                     candles = data["h1"][-5:]  # Last 5 candles
                     for candle in reversed(candles):
-                        from datetime import datetime
                         dt = datetime.fromisoformat(candle.get('timestamp', ''))
                         time_str = dt.strftime("%H:%M")
                         price_info += f"\n- {time_str}: O={candle.get('open'):.5f} H={candle.get('high'):.5f} L={candle.get('low'):.5f} C={candle.get('close'):.5f}"
@@ -230,32 +361,8 @@ Your specific responsibilities are:
 Reflect on your analysis techniques. What additional information or tools would help you create better trade plans? What patterns have had the highest success rate? How can you improve your stop placement?
 """
         
-        # Use raw string for response format to avoid f-string formatting issues
-        response_format = r"""
-## Response Format
-Respond with a JSON object containing:
-1. "analysis_results" array with detailed analysis for each pair:
-   - "epic": Currency pair code
-   - "direction": "BUY" or "SELL"
-   - "analysis_quality": Rating from 1-10
-   - "entry_zone": {"ideal": price, "range_low": price, "range_high": price}
-   - "stop_loss": {"price": level, "pips": distance, "reasoning": explanation}
-   - "take_profit": [{"level": price, "pips": distance, "probability": confidence}]
-   - "risk_reward": Calculated R:R ratio
-   - "position_size_recommendation": Percentage of account or lot size
-   - "trading_plan": Detailed explanation of the setup and execution
-   - "key_indicators": Important technical indicators supporting the trade
-
-2. "market_insights": Overall insights from your analysis
-
-3. "self_improvement":
-   - "analysis_effectiveness": Assessment of your previous analyses
-   - "questions_for_team": Questions for other agents that would help you
-   - "suggestions": Ideas to improve your analysis approach
-"""
-
-        # Combine main prompt with response format
-        return main_prompt + response_format
+        # Combine main prompt with the pre-built static response format
+        return main_prompt + ANALYSIS_ENGINE_RESPONSE_FORMAT
 
     @staticmethod
     def decision_maker(analysis_results, account_data, positions, system_memory, market_data, 
@@ -397,48 +504,8 @@ Your specific responsibilities are:
 Reflect on execution performance. What position sizing has worked best? Which stop strategies have been most effective? How can you better balance the portfolio to achieve the 10% daily target?
 """
         
-        # Use raw string for response format to avoid f-string formatting issues
-        response_format = r"""
-## Response Format
-Respond with a JSON object containing:
-1. "trade_actions" array with specific trades to execute:
-   - "action_type": "OPEN"
-   - "epic": Currency pair code
-   - "direction": "BUY" or "SELL"
-   - "size": Position size
-   - "entry_price": Ideal entry price
-   - "entry_range": [lower, upper] range for entry
-   - "initial_stop_loss": Initial stop loss level
-   - "take_profit_levels": [level1, level2, ...]
-   - "risk_percent": Percentage of account risked
-   - "risk_reward": Expected R:R ratio
-   - "pattern": Pattern being traded
-   - "stop_management": [{"type": "strategy", "settings": {"specific": "settings"}}]
-   - "reasoning": Detailed reasoning for this execution decision
-
-2. "position_actions" array with actions for existing positions:
-   - "action_type": "CLOSE", "UPDATE_STOP", "TAKE_PARTIAL"
-   - "epic": Currency pair code
-   - "dealId": Deal identifier
-   - "new_level": New level for stop or take profit
-   - "percentage": Percentage to close (for partial)
-   - "reason": Explanation for the action
-
-3. "portfolio_assessment":
-   - "current_exposure": Overall market exposure assessment
-   - "risk_distribution": How risk is spread across positions
-   - "correlation_management": How you're managing correlations
-   - "progress_to_daily_goal": Assessment of progress toward 10% target
-
-4. "self_improvement":
-   - "execution_effectiveness": Assessment of your decision making
-   - "questions_for_team": Questions for other agents that would help you
-   - "suggestions": Ideas to improve execution approach
-   - "needs_from_user": What you need from the human trader to improve
-"""
-
-        # Combine main prompt with response format
-        return main_prompt + response_format
+        # Combine main prompt with the pre-built static response format
+        return main_prompt + DECISION_MAKER_RESPONSE_FORMAT
 
     @staticmethod
     def team_review(agent_responses, system_memory, market_data, positions, account_data, daily_perf=None):
@@ -532,32 +599,8 @@ Respond with a JSON object containing:
 5. What information or tools do we need from our human operator?
 """
         
-        # Use raw string for response format to avoid f-string formatting issues
-        response_format = r"""
-## Response Format
-Respond with a JSON object containing:
-1. "team_assessment":
-   - "coordination_quality": Rating from 1-10
-   - "progress_to_goal": Assessment of progress toward 10% daily target
-   - "key_strengths": What's working well
-   - "key_weaknesses": Areas needing improvement
-
-2. "agent_feedback":
-   - "scout": Specific feedback and advice for the scout
-   - "strategist": Specific feedback and advice for the strategist
-   - "executor": Specific feedback and advice for the executor
-
-3. "strategy_adjustments":
-   - "risk_management": Suggested changes to risk approach
-   - "pair_selection": Suggested changes to market focus
-   - "technical_approach": Suggested changes to analysis methods
-
-4. "requests_for_human":
-   - Specific questions or requests for the human operator
-"""
-
-        # Combine main prompt with response format
-        return main_prompt + response_format
+        # Combine main prompt with the pre-built static response format
+        return main_prompt + TEAM_REVIEW_RESPONSE_FORMAT
 
     @staticmethod
     def position_manager(positions, market_data, system_memory, execution_history=None):
@@ -645,26 +688,8 @@ Analyze each open position and determine:
 5. NO CHANGE - Leave position as is
 """
         
-        # Use raw string for response format to avoid f-string formatting issues
-        response_format = r"""
-## Response Format
-Respond with a JSON object containing:
-1. "position_actions" array with actions for each position:
-   - "action_type": "CLOSE", "UPDATE_STOP", "TAKE_PARTIAL", "NO_CHANGE"
-   - "epic": Currency pair code
-   - "dealId": Deal identifier
-   - "new_level": New level for stop (if applicable)
-   - "percentage": Percentage to close (if applicable)
-   - "reason": Detailed reasoning for this action
-
-2. "risk_assessment":
-   - "overall_portfolio_risk": Assessment of current risk level
-   - "primary_threats": Main risks to current positions
-   - "recommended_adjustments": General portfolio adjustment recommendations
-"""
-
-        # Combine main prompt with response format
-        return main_prompt + response_format
+        # Combine main prompt with the pre-built static response format
+        return main_prompt + POSITION_MANAGER_RESPONSE_FORMAT
 
     @staticmethod
     def system_optimizer(all_logs, system_memory, budget_status, performance_metrics):
@@ -766,32 +791,5 @@ Analyze all available data to:
 5. Provide actionable insights to improve performance
 """
         
-        # Use raw string for response format to avoid f-string formatting issues
-        response_format = r"""
-## Response Format
-Respond with a JSON object containing:
-1. "system_assessment":
-   - "overall_performance": Rating from 1-10
-   - "progress_to_goal": Assessment of progress toward 10% daily target
-   - "key_strengths": What's working well
-   - "key_weaknesses": Areas needing improvement
-
-2. "optimization_recommendations":
-   - "budget_allocation": {"scout": percentage, "strategist": percentage, "executor": percentage}
-   - "risk_parameters": {"base_risk": percentage, "risk_multiplier": factor}
-   - "pattern_focus": Array of most effective patterns to prioritize
-   - "timeframe_focus": Most effective timeframes to focus on
-
-3. "process_improvements":
-   - "scout_recommendations": Specific improvements for the scout agent
-   - "strategist_recommendations": Specific improvements for the strategist agent
-   - "executor_recommendations": Specific improvements for the executor agent
-
-4. "technical_improvements":
-   - Specific technical enhancements to the system
-   - Data sources that would improve decision making
-   - Algorithmic improvements to consider
-"""
-
-        # Combine main prompt with response format
-        return main_prompt + response_format
\ No newline at end of file
+        # Combine main prompt with the pre-built static response format
+        return main_prompt + SYSTEM_OPTIMIZER_RESPONSE_FORMAT
\ No newline at end of file
@@ -5,11 +5,35 @@ Handles connections to trading platforms and data providers
 
 import os
 import logging
+import time
+import requests
+from datetime import datetime, timezone
 from trading_ig import IGService
-from polygon import RESTClient
+from utils.retry import call_with_retries
 
 logger = logging.getLogger("CollaborativeTrader")
 
+# Account details change rarely, but the connection check and every
+# trade-time safety check each issued their own fetch_accounts call.
+# Cache the last response briefly and share it between them.
+ACCOUNTS_CACHE_TTL = 30
+_accounts_cache = {"fetched_at": 0.0, "accounts": None}
+
+def invalidate_accounts_cache():
+    """Drop the cached accounts so the next check fetches fresh balances"""
+    _accounts_cache["accounts"] = None
+
+def fetch_accounts_cached(ig_service, max_age=ACCOUNTS_CACHE_TTL):
+    """Fetch IG accounts, reusing a recent response when available"""
+    now = time.time()
+    if _accounts_cache["accounts"] is None or now - _accounts_cache["fetched_at"] > max_age:
+        _accounts_cache["accounts"] = call_with_retries(
+            ig_service.fetch_accounts, description="IG fetch_accounts",
+            retryable=(requests.ConnectionError, requests.Timeout)
+        )
+        _accounts_cache["fetched_at"] = now
+    return _accounts_cache["accounts"]
+
 def get_ig_service():
     """Connect to IG API with account safety checks"""
     try:
@@ -30,7 +54,7 @@ def get_ig_service():
         
         # Check active account
         try:
-            accounts = ig.fetch_accounts()
+            accounts = fetch_accounts_cached(ig, max_age=0)
             logger.info(f"Found {len(accounts)} accounts")
             
             # Display all available accounts
@@ -63,24 +87,20 @@ def get_ig_service():
                 print(f"{'*' * 60}\n")
                 
                 # Check if the active account has sufficient balance
-                active_acc_data = accounts[accounts['accountId'] == active_account]
-                if not active_acc_data.empty:
-                    active_balance = active_acc_data.iloc[0]['balance']
-                    active_currency = active_acc_data.iloc[0]['currency']
-                    
-                    if active_balance <= 0:
-                        logger.warning(f"Account {active_account} has insufficient balance: {active_balance} {active_currency}")
-                        print(f"\nWARNING: ACCOUNT BALANCE IS {active_balance} {active_currency}")
-                        print(f"The system may not be able to execute trades with this balance\n")
+                active = accounts.iloc[0]
+                active_balance = active['balance']
+                active_currency = active['currency']
+
+                if active_balance <= 0:
+                    logger.warning(f"Account {active_account} has insufficient balance: {active_balance} {active_currency}")
+                    print(f"\nWARNING: ACCOUNT BALANCE IS {active_balance} {active_currency}")
+                    print(f"The system may not be able to execute trades with this balance\n")
             else:
                 logger.info(f"Successfully connected to desired account {target_account}")
                 
                 # Display balance of active account
-                active_acc_data = accounts[accounts['accountId'] == active_account]
-                if not active_acc_data.empty:
-                    active_balance = active_acc_data.iloc[0]['balance']
-                    active_currency = active_acc_data.iloc[0]['currency']
-                    logger.info(f"Account balance: {active_balance} {active_currency}")
+                active = accounts.iloc[0]
+                logger.info(f"Account balance: {active['balance']} {active['currency']}")
                 
         except Exception as e:
             logger.error(f"Error checking account details: {e}")
@@ -91,10 +111,6 @@ def get_ig_service():
         logger.error(f"IG connection error: {e}")
         return None
 
-def get_polygon_client():
-    """Get Polygon API client"""
-    return RESTClient(os.getenv("POLYGON_API_KEY"))
-
 def execute_trade(ig_service, trade):
     """Execute a new trade on IG platform with account safety check"""
     try:
@@ -102,10 +118,11 @@ def execute_trade(ig_service, trade):
         
         # SAFETY CHECK - verify account before trading
         try:
-            accounts = ig_service.fetch_accounts()
-            active_account = accounts.iloc[0]['accountId']
-            active_balance = accounts[accounts['accountId'] == active_account].iloc[0]['balance']
-            active_currency = accounts[accounts['accountId'] == active_account].iloc[0]['currency']
+            accounts = fetch_accounts_cached(ig_service)
+            active = accounts.iloc[0]
+            active_account = active['accountId']
+            active_balance = active['balance']
+            active_currency = active['currency']
             
             # Check if using INQFH with zero balance
             if active_account == "INQFH" and active_balance <= 0:
@@ -134,10 +151,12 @@ def execute_trade(ig_service, trade):
         )
         
         logger.info(f"Trade response: {response}")
-        
+
+        # The order changes balance and margin - drop the cached accounts
+        # so the next safety check sees the post-trade state
+        invalidate_accounts_cache()
+
         # Prepare trade log data
-        from datetime import datetime, timezone
-        
         trade_data = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "epic": trade["epic"],
@@ -160,7 +179,7 @@ def execute_trade(ig_service, trade):
         logger.error(f"Trade execution error: {e}")
         return False, {"outcome": "ERROR", "reason": str(e)}
 
-def close_position(ig_service, position_action, positions):
+def close_position(ig_service, position_action, positions_by_deal):
     """Close an existing position with account safety check"""
     try:
         deal_id = position_action.get("dealId")
@@ -168,9 +187,10 @@ def close_position(ig_service, position_action, positions):
         
         # SAFETY CHECK - verify account is valid for trading
         try:
-            accounts = ig_service.fetch_accounts()
-            active_account = accounts.iloc[0]['accountId']
-            active_balance = accounts[accounts['accountId'] == active_account].iloc[0]['balance']
+            accounts = fetch_accounts_cached(ig_service)
+            active = accounts.iloc[0]
+            active_account = active['accountId']
+            active_balance = active['balance']
             
             if active_account == "INQFH" and active_balance <= 0:
                 logger.error(f"POSITION CLOSE BLOCKED - Account {active_account} has zero balance")
@@ -181,18 +201,18 @@ def close_position(ig_service, position_action, positions):
             logger.warning(f"Could not verify account before closing position: {check_error}")
         
         logger.info(f"Closing position {deal_id} | {epic}")
-        
+
         # Find position details
-        position = positions[positions["dealId"] == deal_id]
-        
-        if position.empty:
+        position = positions_by_deal.get(deal_id)
+
+        if not position:
             logger.warning(f"Position not found for close: {deal_id}")
             return False, {"outcome": "FAILED", "reason": "Position not found"}
-            
+
         # Get position details
-        direction = position.iloc[0].get("direction")
-        size = position.iloc[0].get("size")
-        
+        direction = position.get("direction")
+        size = position.get("size")
+
         # Execute close
         close_direction = "SELL" if direction == "BUY" else "BUY"
         
@@ -202,10 +222,11 @@ def close_position(ig_service, position_action, positions):
             size=float(size),
             order_type="MARKET"
         )
-        
+
+        # Closing releases margin and realizes P&L - invalidate the cache
+        invalidate_accounts_cache()
+
         # Log the close
-        from datetime import datetime, timezone
-        
         close_data = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "epic": epic,
@@ -229,9 +250,10 @@ def update_stop_loss(ig_service, position_action):
         
         # SAFETY CHECK - verify account is valid for trading
         try:
-            accounts = ig_service.fetch_accounts()
-            active_account = accounts.iloc[0]['accountId']
-            active_balance = accounts[accounts['accountId'] == active_account].iloc[0]['balance']
+            accounts = fetch_accounts_cached(ig_service)
+            active = accounts.iloc[0]
+            active_account = active['accountId']
+            active_balance = active['balance']
             
             if active_account == "INQFH" and active_balance <= 0:
                 logger.error(f"STOP UPDATE BLOCKED - Account {active_account} has zero balance")
@@ -249,8 +271,6 @@ def update_stop_loss(ig_service, position_action):
         )
         
         # Log the update
-        from datetime import datetime, timezone
-        
         update_data = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "epic": epic,
@@ -0,0 +1,34 @@
+"""
+Retry Utilities
+Shared timeout and exponential-backoff handling for external API calls
+"""
+
+import logging
+import time
+
+logger = logging.getLogger("CollaborativeTrader")
+
+def call_with_retries(func, *args, description="API call", retries=3, base_delay=1.0,
+                      retryable=(TimeoutError, ConnectionError), **kwargs):
+    """Call func with exponential-backoff retries on transient failures
+
+    Only exceptions matching the retryable tuple are retried - callers
+    pass the timeout/connection error types of their client library.
+    Anything else (bad requests, auth failures) propagates immediately,
+    and the final transient failure is re-raised so callers keep their
+    existing error handling. Waits base_delay, then doubles it before
+    each subsequent attempt.
+    """
+    delay = base_delay
+    for attempt in range(retries + 1):
+        try:
+            return func(*args, **kwargs)
+        except retryable as e:
+            if attempt >= retries:
+                raise
+            logger.warning(
+                f"{description} failed (attempt {attempt + 1}/{retries + 1}): {e}. "
+                f"Retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+            delay *= 2